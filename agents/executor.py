@@ -1,7 +1,12 @@
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Set, Tuple
+import asyncio
+import inspect
+import re
 import sys
 import os
 
+import cachetools
+
 # Add parent directory to path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
@@ -11,6 +16,18 @@ from tools.news_tool import NewsTool
 from tools.serp_tool import SerpTool
 
 
+# Matches references to earlier step outputs inside parameter values
+_STEP_REF_PATTERN = re.compile(r"step_(\d+)")
+
+# How long a cached tool result stays fresh, by tool (seconds)
+TTL_BY_TOOL = {
+    "weather": 600,
+    "news": 300,
+    "github": 60,
+    "serp": 300
+}
+
+
 class ExecutorAgent:
     def __init__(self):
         self.tools = {
@@ -20,7 +37,53 @@ class ExecutorAgent:
             "serp": SerpTool()
         }
 
-    def execute_plan(self, plan: Dict[str, Any]) -> Dict[str, Any]:
+        # Per-tool TTL caches: identical (tool, function, params) calls
+        # within the freshness window skip the remote API entirely
+        self._caches = {
+            tool_name: cachetools.TTLCache(maxsize=1024, ttl=TTL_BY_TOOL.get(tool_name, 300))
+            for tool_name in self.tools
+        }
+
+        # Explicit allowlist of callable tool methods. Plan steps come from
+        # LLM output, so only names declared here are ever dispatched —
+        # nothing else on the tool objects is reachable by string lookup
+        github = self.tools["github"]
+        weather = self.tools["weather"]
+        news = self.tools["news"]
+        serp = self.tools["serp"]
+        self._allowed = {
+            "github": {
+                "search_repositories": github.search_repositories,
+                "get_repository": github.get_repository,
+                "get_user_repos": github.get_user_repos
+            },
+            "weather": {
+                "get_current_weather": weather.get_current_weather,
+                "get_weather_forecast": weather.get_weather_forecast,
+                "get_weather_by_coordinates": weather.get_weather_by_coordinates
+            },
+            "news": {
+                "get_top_headlines": news.get_top_headlines,
+                "search_news": news.search_news,
+                "get_sources": news.get_sources
+            },
+            "serp": {
+                "search": serp.search,
+                "search_news": serp.search_news,
+                "search_images": serp.search_images,
+                "get_answer_box": serp.get_answer_box
+            }
+        }
+
+        # API keys do not change while the process runs, so snapshot once
+        self._tool_status = {
+            "github": bool(os.environ.get("GITHUB_API_KEY")),
+            "weather": bool(os.environ.get("OPENWEATHER_API_KEY")),
+            "news": bool(os.environ.get("NEWS_API_KEY")),
+            "serp": bool(os.environ.get("SERP_API_KEY"))
+        }
+
+    async def execute_plan(self, plan: Dict[str, Any]) -> Dict[str, Any]:
         results = {
             "task": plan.get("task_understanding", "Unknown task"),
             "steps_executed": [],
@@ -30,30 +93,33 @@ class ExecutorAgent:
 
         steps = plan.get("steps", [])
 
-        for step in steps:
-            step_number = step.get("step_number")
-            step_result = self.execute_step(step)
-
-            results["steps_executed"].append({
-                "step_number": step_number,
-                "action": step.get("action"),
-                "tool": step.get("tool"),
-                "function": step.get("function"),
-                "status": "success" if not (isinstance(step_result, dict) and "error" in step_result) else "failed",
-                "result": step_result
-            })
-
-            # Store raw data for verifier
-            step_key = f"step_{step_number}"
-            results["raw_data"][step_key] = step_result
-
-            # Track errors
-            if isinstance(step_result, dict) and "error" in step_result:
-                results["errors"].append({
-                    "step": step_number,
-                    "error": step_result["error"]
+        # Steps that do not depend on each other run concurrently,
+        # overlapping network I/O instead of paying N sequential round trips
+        for level in self._dependency_levels(steps):
+            step_results = await self._execute_level(level)
+
+            for step, step_result in zip(level, step_results):
+                step_number = step.get("step_number")
+
+                results["steps_executed"].append({
+                    "step_number": step_number,
+                    "action": step.get("action"),
+                    "tool": step.get("tool"),
+                    "function": step.get("function"),
+                    "status": "success" if not (isinstance(step_result, dict) and "error" in step_result) else "failed",
+                    "result": step_result
                 })
 
+                # Store raw data for verifier
+                step_key = f"step_{step_number}"
+                results["raw_data"][step_key] = step_result
+
+                # Track errors
+                if isinstance(step_result, dict) and "error" in step_result:
+                    results["errors"].append({
+                        "step": step_number,
+                        "error": step_result["error"]
+                    })
 
         if not results["errors"] and results["raw_data"] and steps:
             last_step_key = f"step_{steps[-1].get('step_number')}"
@@ -61,37 +127,154 @@ class ExecutorAgent:
 
         return results
 
-    def execute_step(self, step: Dict[str, Any]) -> Any:
+    async def _execute_level(self, level: List[Dict[str, Any]]) -> List[Any]:
+        """Run one level of independent steps, coalescing GitHub repo lookups"""
+        batchable = [
+            step for step in level
+            if step.get("tool") == "github"
+            and step.get("function") == "get_repository"
+            and isinstance(step.get("parameters"), dict)
+            and "owner" in step["parameters"]
+            and "repo" in step["parameters"]
+        ]
+
+        # A single lookup (or none) gains nothing from GraphQL batching
+        if len(batchable) < 2:
+            return await asyncio.gather(*[self.execute_step(step) for step in level])
+
+        batch_ids = {id(step) for step in batchable}
+        other_steps = [step for step in level if id(step) not in batch_ids]
+
+        gathered = await asyncio.gather(
+            self._execute_repository_batch(batchable),
+            *[self.execute_step(step) for step in other_steps]
+        )
+
+        result_by_step = {
+            id(step): result for step, result in zip(batchable, gathered[0])
+        }
+        result_by_step.update(
+            (id(step), result) for step, result in zip(other_steps, gathered[1:])
+        )
+        return [result_by_step[id(step)] for step in level]
+
+    async def _execute_repository_batch(self, steps: List[Dict[str, Any]]) -> List[Any]:
+        """N get_repository steps collapse into one GraphQL round trip"""
+        refs = [
+            (step["parameters"]["owner"], step["parameters"]["repo"])
+            for step in steps
+        ]
+
+        try:
+            results = await self.tools["github"].get_repositories_batch(refs)
+        except Exception as e:
+            return [{"error": f"Execution failed: {str(e)}"} for _ in steps]
+
+        # Successful lookups also warm the per-call cache so a later
+        # single get_repository for the same repo stays local
+        cache = self._caches["github"]
+        for step, result in zip(steps, results):
+            if isinstance(result, dict) and "error" in result:
+                continue
+            cache_key = self._cache_key("github", "get_repository", step["parameters"])
+            if cache_key is not None:
+                cache[cache_key] = result
+
+        return results
+
+    def _dependency_levels(self, steps: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+        """Group steps into levels where each level only depends on earlier ones"""
+        levels = []
+        resolved: Set[int] = set()
+        remaining = list(steps)
+
+        while remaining:
+            level = [
+                step for step in remaining
+                if self._step_dependencies(step) <= resolved
+            ]
+
+            # Unresolvable references (cycle or typo): fall back to running
+            # everything left in plan order
+            if not level:
+                level = remaining
+
+            level_ids = {id(step) for step in level}
+            remaining = [step for step in remaining if id(step) not in level_ids]
+
+            for step in level:
+                step_number = step.get("step_number")
+                if isinstance(step_number, int):
+                    resolved.add(step_number)
+
+            levels.append(level)
+
+        return levels
+
+    def _step_dependencies(self, step: Dict[str, Any]) -> Set[int]:
+        """Collect step numbers referenced by this step's parameter values"""
+        dependencies: Set[int] = set()
+        for value in (step.get("parameters") or {}).values():
+            if isinstance(value, str):
+                for match in _STEP_REF_PATTERN.finditer(value):
+                    dependencies.add(int(match.group(1)))
+        return dependencies
+
+    async def execute_step(self, step: Dict[str, Any]) -> Any:
         tool_name = step.get("tool")
         function_name = step.get("function")
         parameters = step.get("parameters", {})
 
-        if tool_name not in self.tools:
+        allowed = self._allowed.get(tool_name)
+        if allowed is None:
             return {"error": f"Tool '{tool_name}' not found"}
 
-        tool = self.tools[tool_name]
-
-        if not hasattr(tool, function_name):
+        function = allowed.get(function_name)
+        if function is None:
             return {"error": f"Function '{function_name}' not found in tool '{tool_name}'"}
 
+        cache = self._caches[tool_name]
+        cache_key = self._cache_key(tool_name, function_name, parameters)
+        if cache_key is not None:
+            cached = cache.get(cache_key)
+            if cached is not None:
+                return cached
+
         try:
-            function = getattr(tool, function_name)
-            result = function(**parameters)
+            result = await self._call_tool_function(function, parameters)
 
             # Retry once if tool returns error
             if isinstance(result, dict) and "error" in result:
-                result = function(**parameters)
+                result = await self._call_tool_function(function, parameters)
+
+            if cache_key is not None and not (isinstance(result, dict) and "error" in result):
+                cache[cache_key] = result
 
             return result
 
         except Exception as e:
             return {"error": f"Execution failed: {str(e)}"}
 
+    def _cache_key(
+        self,
+        tool_name: str,
+        function_name: str,
+        parameters: Dict[str, Any]
+    ) -> Optional[Tuple]:
+        """Hashable cache key for a tool call, or None if params are unhashable"""
+        try:
+            key = (tool_name, function_name, tuple(sorted(parameters.items())))
+            hash(key)
+            return key
+        except TypeError:
+            return None
+
+    async def _call_tool_function(self, function, parameters: Dict[str, Any]) -> Any:
+        """Await async tool methods; run still-synchronous ones off the event loop"""
+        if inspect.iscoroutinefunction(function):
+            return await function(**parameters)
+        return await asyncio.to_thread(function, **parameters)
+
     def get_tool_status(self) -> Dict[str, bool]:
 
-        return {
-            "github": bool(os.environ.get("GITHUB_API_KEY")),
-            "weather": bool(os.environ.get("OPENWEATHER_API_KEY")),
-            "news": bool(os.environ.get("NEWS_API_KEY")),
-            "serp": bool(os.environ.get("SERP_API_KEY"))
-        }
+        return self._tool_status
@@ -7,14 +7,46 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from llm.client import LLMClient
 
+import fastjsonschema
+
+
+# Mirrors the JSON SCHEMA block in the planner system prompt
+PLAN_SCHEMA = {
+    "type": "object",
+    "required": ["task_understanding", "required_tools", "steps", "expected_output"],
+    "properties": {
+        "task_understanding": {"type": "string"},
+        "required_tools": {
+            "type": "array",
+            "items": {"type": "string"}
+        },
+        "steps": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "required": ["step_number", "action", "tool", "function", "parameters"],
+                "properties": {
+                    "step_number": {"type": "integer"},
+                    "action": {"type": "string"},
+                    "tool": {"type": "string"},
+                    "function": {"type": "string"},
+                    "parameters": {"type": "object"},
+                    "reasoning": {"type": "string"}
+                }
+            }
+        },
+        "expected_output": {"type": "string"}
+    }
+}
 
-class PlannerAgent:
+# Compiled once at import time; generated straight-line code is far faster
+# than looping over field names per plan
+PLAN_VALIDATOR = fastjsonschema.compile(PLAN_SCHEMA)
 
-    def __init__(self):
-        self.llm = LLMClient()
 
-    def create_plan(self, user_task: str) -> Dict[str, Any]:
-        system_prompt = """
+# Built once at import: the prompt is ~2KB and identical for every
+# request, which also keeps the serving-side prompt prefix stable
+_SYSTEM_PROMPT = """
 You are a task planning agent. Your job is to analyze user requests and create a precise execution plan.
 
 ====================
@@ -124,15 +156,21 @@ Correct JSON Output:
 }
 """
 
-        user_message = f"""
-User Task: {user_task}
 
-Create the execution plan now.
-"""
+class PlannerAgent:
+
+    def __init__(self):
+        self.llm = LLMClient()
+
+    def create_plan(self, user_task: str) -> Dict[str, Any]:
+        # Keep everything before the variable task byte-identical across
+        # requests so the serving side can reuse the KV-cache for the
+        # shared prompt prefix; only the task text varies, at the very end
+        user_message = "Create an execution plan. User Task: " + user_task
 
         try:
             plan = self.llm.generate_json(
-                system_prompt=system_prompt,
+                system_prompt=_SYSTEM_PROMPT,
                 user_message=user_message,
                 temperature=0.2
             )
@@ -152,17 +190,9 @@ Create the execution plan now.
             }
 
     def _validate_plan(self, plan: Dict[str, Any]) -> bool:
-        
-        required_fields = ["task_understanding", "required_tools", "steps", "expected_output"]
-        if not all(field in plan for field in required_fields):
-            return False
 
-        if not isinstance(plan["steps"], list):
+        try:
+            PLAN_VALIDATOR(plan)
+            return True
+        except fastjsonschema.JsonSchemaException:
             return False
-
-        for step in plan["steps"]:
-            step_fields = ["step_number", "action", "tool", "function", "parameters"]
-            if not all(field in step for field in step_fields):
-                return False
-
-        return True
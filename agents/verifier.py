@@ -46,22 +46,14 @@ class VerifierAgent:
             if not articles:
                 return "No relevant news articles were found."
 
-            lines = [
-                "Here are the most recent Tesla-related news articles from the last month:\n"
-            ]
-
-            for i, article in enumerate(articles, start=1):
-                title = article.get("title", "No title")
-                source = article.get("source", {}).get("name", "Unknown source")
-                published = article.get("publishedAt", "Unknown date")
-                url = article.get("url", "")
-
-                lines.append(
-                    f"{i}. {title}\n"
-                    f"   Source: {source}\n"
-                    f"   Published: {published}\n"
-                    f"   Link: {url}\n"
-                )
+            lines = [f"Here are the most recent news articles for: {task}\n"]
+            lines.extend(
+                f"{i}. {article.get('title', 'No title')}\n"
+                f"   Source: {(article.get('source') or {}).get('name', 'Unknown source')}\n"
+                f"   Published: {article.get('publishedAt', 'Unknown date')}\n"
+                f"   Link: {article.get('url', '')}\n"
+                for i, article in enumerate(articles, start=1)
+            )
 
             return "\n".join(lines)
 
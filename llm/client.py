@@ -1,9 +1,16 @@
 import os
-import json
-from typing import Dict, Any
+import copy
+import hashlib
+import orjson
+from collections import OrderedDict
+from typing import Dict, Any, Optional
 from openai import OpenAI
 
 
+# Maximum number of parsed JSON responses kept in the per-client cache
+_CACHE_MAXSIZE = 512
+
+
 class LLMClient:
     """Wrapper for Nebius OpenAI-compatible API"""
 
@@ -20,17 +27,41 @@ class LLMClient:
         # ✅ Correct Nebius OSS model
         self.model = "openai/gpt-oss-20b"
 
+        # LRU cache of parsed JSON responses; planner prompts repeat heavily
+        # across requests, so exact-match hits skip the LLM round trip
+        self._cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
     def generate(
         self,
         system_prompt: str,
         user_message: str,
         temperature: float = 0.7,
-        max_tokens: int = 2000
+        max_tokens: int = 2000,
+        response_format: Optional[Dict[str, Any]] = None,
+        stream: bool = False
     ) -> str:
         """
         Generate a text response from the LLM
         """
         try:
+            if stream:
+                content = "".join(self._iter_stream(
+                    system_prompt=system_prompt,
+                    user_message=user_message,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    response_format=response_format
+                ))
+
+                if not content:
+                    raise Exception("LLM returned empty or invalid content")
+
+                return content
+
+            kwargs: Dict[str, Any] = {}
+            if response_format is not None:
+                kwargs["response_format"] = response_format
+
             response = self.client.chat.completions.create(
                 model=self.model,
                 messages=[
@@ -38,7 +69,8 @@ class LLMClient:
                     {"role": "user", "content": user_message}
                 ],
                 temperature=temperature,
-                max_tokens=max_tokens
+                max_tokens=max_tokens,
+                **kwargs
             )
 
             # ✅ HARD GUARD
@@ -55,6 +87,37 @@ class LLMClient:
         except Exception as e:
             raise Exception(f"LLM generation failed: {str(e)}")
 
+    def _iter_stream(
+        self,
+        system_prompt: str,
+        user_message: str,
+        temperature: float,
+        max_tokens: int,
+        response_format: Optional[Dict[str, Any]] = None
+    ):
+        """Yield content deltas from a streamed completion as they arrive"""
+        kwargs: Dict[str, Any] = {}
+        if response_format is not None:
+            kwargs["response_format"] = response_format
+
+        stream = self.client.chat.completions.create(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_message}
+            ],
+            temperature=temperature,
+            max_tokens=max_tokens,
+            stream=True,
+            **kwargs
+        )
+
+        for chunk in stream:
+            if chunk.choices:
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    yield delta
+
     def generate_json(
         self,
         system_prompt: str,
@@ -66,40 +129,66 @@ class LLMClient:
         Generate a STRICT JSON response from the LLM
         """
 
-        json_system_prompt = f"""{system_prompt}
+        cache_key = self._cache_key(system_prompt, user_message, temperature)
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            self._cache.move_to_end(cache_key)
+            # Deep copy so callers cannot mutate the cached entry
+            return copy.deepcopy(cached)
+
+        # Stream the completion and trial-parse whenever a closing brace
+        # arrives, so we stop consuming as soon as the document is whole
+        # instead of waiting out the full generation
+        response_text = ""
+        parsed = None
+        try:
+            buf = []
+            for delta in self._iter_stream(
+                system_prompt=system_prompt,
+                user_message=user_message,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                response_format={"type": "json_object"}
+            ):
+                buf.append(delta)
+
+                if "}" in delta:
+                    response_text = "".join(buf).strip()
+                    try:
+                        parsed = orjson.loads(response_text)
+                        break
+                    except orjson.JSONDecodeError:
+                        continue
+
+            if parsed is None:
+                response_text = "".join(buf).strip()
 
-CRITICAL INSTRUCTIONS:
-- Respond ONLY with valid JSON
-- Do NOT include explanations
-- Do NOT include markdown
-- Do NOT include code blocks
-"""
+        except Exception as e:
+            raise Exception(f"LLM generation failed: {str(e)}")
 
-        response_text = self.generate(
-            system_prompt=json_system_prompt,
-            user_message=user_message,
-            temperature=temperature,
-            max_tokens=max_tokens
-        )
+        if parsed is None:
+            # ✅ HARD GUARD AGAINST None / EMPTY
+            if not response_text:
+                raise Exception("LLM returned empty or invalid response")
 
-        # ✅ HARD GUARD AGAINST None / EMPTY
-        if not response_text or not isinstance(response_text, str):
-            raise Exception("LLM returned empty or invalid response")
+            try:
+                parsed = orjson.loads(response_text)
 
-        response_text = response_text.strip()
+            except orjson.JSONDecodeError as e:
+                raise Exception(
+                    "Failed to parse JSON from LLM response\n"
+                    f"Error: {str(e)}\n"
+                    f"Raw response:\n{response_text}"
+                )
 
-        # ✅ Remove markdown if model ignores instructions
-        if response_text.startswith("```"):
-            parts = response_text.split("```")
-            if len(parts) >= 2:
-                response_text = parts[1].strip()
+        self._cache[cache_key] = copy.deepcopy(parsed)
+        self._cache.move_to_end(cache_key)
+        if len(self._cache) > _CACHE_MAXSIZE:
+            self._cache.popitem(last=False)
 
-        try:
-            return json.loads(response_text)
+        return parsed
 
-        except json.JSONDecodeError as e:
-            raise Exception(
-                "Failed to parse JSON from LLM response\n"
-                f"Error: {str(e)}\n"
-                f"Raw response:\n{response_text}"
-            )
+    def _cache_key(self, system_prompt: str, user_message: str, temperature: float) -> str:
+        """Exact-match cache key over model, temperature and both prompts"""
+        raw = f"{self.model}|{temperature}|{system_prompt}|{user_message}"
+        return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
@@ -1,8 +1,15 @@
 
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from typing import Dict, Any, Optional
+from contextlib import asynccontextmanager
+import asyncio
+import cachetools
+import logging
+import logging.handlers
+import queue
 import uvicorn
 import os
 
@@ -12,13 +19,54 @@ load_dotenv()
 from agents.planner import PlannerAgent
 from agents.executor import ExecutorAgent
 from agents.verifier import VerifierAgent
+from tools._http import get_async_client, close_async_client
+
+
+# Request-path logging goes through a queue so handlers only enqueue a
+# record; a background listener does the actual stdout writes, keeping
+# concurrent requests from serializing on the stream lock
+_log_queue: "queue.Queue" = queue.Queue(-1)
+_log_listener = logging.handlers.QueueListener(_log_queue, logging.StreamHandler())
+_log_listener.start()
+
+logger = logging.getLogger("aiops")
+logger.setLevel(logging.INFO)
+logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+
+
+# Completed high-confidence answers, keyed by normalized task text, so a
+# repeated task within 10 minutes skips the planner LLM and every tool call
+_answer_cache: "cachetools.TTLCache" = cachetools.TTLCache(maxsize=1024, ttl=600)
+
+
+def _task_cache_key(task: str, include_raw_data: bool) -> tuple:
+    return (" ".join(task.split()).lower(), bool(include_raw_data))
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Build process-wide singletons once per worker: the shared HTTP
+    # connection pool (tools resolve it lazily), the agents, and their
+    # import-time-compiled plan validator all warm up here instead of
+    # on the first request
+    get_async_client()
+    app.state.planner = PlannerAgent()
+    app.state.executor = ExecutorAgent()
+    app.state.verifier = VerifierAgent()
+
+    yield
+
+    await close_async_client()
+    _log_listener.stop()
 
 
 # Initialize FastAPI app
 app = FastAPI(
     title="AI Operations Assistant",
     description="Multi-agent AI system for task automation with LLM-powered reasoning",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 # Add CORS middleware
@@ -30,12 +78,6 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Initialize agents
-planner = PlannerAgent()
-executor = ExecutorAgent()
-verifier = VerifierAgent()
-
-
 # Request/Response Models
 class TaskRequest(BaseModel):
     task: str
@@ -87,7 +129,7 @@ async def health_check():
             "verifier": "ready"
         },
         "api_keys_configured": env_status,
-        "tools_available": executor.get_tool_status()
+        "tools_available": app.state.executor.get_tool_status()
     }
 
 
@@ -147,14 +189,18 @@ async def process_task(request: TaskRequest):
                 status_code=500,
                 detail="NEBIUS_API_KEY not configured. Please set it in .env file."
             )
-        
- 
-        print(f"\n{'='*60}")
-        print(f"Processing task: {request.task}")
-        print(f"{'='*60}\n")
-        
-        print("Step 1: Creating execution plan...")
-        plan = planner.create_plan(request.task)
+        cache_key = _task_cache_key(request.task, request.include_raw_data)
+        cached_response = _answer_cache.get(cache_key)
+        if cached_response is not None:
+            logger.info("Returning cached answer for task: %s", request.task)
+            return cached_response
+
+        logger.info("Processing task: %s", request.task)
+
+        logger.info("Step 1: Creating execution plan...")
+        # The planner's LLM call is synchronous; run it off the event loop
+        # so concurrent /process requests are not serialized behind it
+        plan = await asyncio.to_thread(app.state.planner.create_plan, request.task)
         
         if "error" in plan:
             raise HTTPException(
@@ -162,31 +208,28 @@ async def process_task(request: TaskRequest):
                 detail=f"Planning failed: {plan['error']}"
             )
         
-        print(f"✓ Plan created with {len(plan.get('steps', []))} steps")
-        
+        logger.info("Plan created with %d steps", len(plan.get("steps", [])))
 
-        print("\nStep 2: Executing plan...")
-        execution_results = executor.execute_plan(plan)
+        logger.info("Step 2: Executing plan...")
+        execution_results = await app.state.executor.execute_plan(plan)
         
         error_count = len(execution_results.get("errors", []))
         success_count = len(execution_results.get("steps_executed", [])) - error_count
-        print(f"✓ Execution complete: {success_count} successful, {error_count} errors")
-        
+        logger.info("Execution complete: %d successful, %d errors", success_count, error_count)
 
-        print("\nStep 3: Verifying results...")
-        verification = verifier.verify_results(
+        logger.info("Step 3: Verifying results...")
+        verification = await asyncio.to_thread(
+            app.state.verifier.verify_results,
             original_task=request.task,
             execution_results=execution_results,
             plan=plan
         )
-        
-        print(f"✓ Verification complete: {verification.get('confidence', 'unknown')} confidence")
-        
 
-        formatted_output = verifier.format_output(verification)
-        
-        print("\n" + formatted_output)
-        
+        logger.info("Verification complete: %s confidence", verification.get("confidence", "unknown"))
+
+
+        formatted_output = await asyncio.to_thread(app.state.verifier.format_output, verification)
+
 
         response = {
             "status": "complete" if verification.get("is_complete") else "partial",
@@ -203,7 +246,11 @@ async def process_task(request: TaskRequest):
             },
             "formatted_output": formatted_output
         }
-        
+
+        # Only fully-verified answers are worth replaying to later callers
+        if verification.get("is_complete") and verification.get("confidence") == "high":
+            _answer_cache[cache_key] = response
+
         return response
     
     except HTTPException:
@@ -219,7 +266,7 @@ async def process_task(request: TaskRequest):
 async def create_plan_only(request: TaskRequest):
     """Create an execution plan without executing it"""
     try:
-        plan = planner.create_plan(request.task)
+        plan = await asyncio.to_thread(app.state.planner.create_plan, request.task)
         return {
             "status": "success",
             "task": request.task,
@@ -246,10 +293,24 @@ if __name__ == "__main__":
     print(f"Alternative docs: http://{host}:{port}/redoc")
     print("\nPress Ctrl+C to stop the server\n")
     
-    uvicorn.run(
-        "main:app",
-        host=host,
-        port=port,
-        reload=True, 
-        log_level="info"
-    )
\ No newline at end of file
+    if os.environ.get("ENV") == "prod":
+        # Multiple workers plus the uvloop event loop and httptools HTTP
+        # parser; --reload is dev-only (it forces a single worker and
+        # re-scans the source tree)
+        uvicorn.run(
+            "main:app",
+            host=host,
+            port=port,
+            workers=int(os.environ.get("WORKERS", os.cpu_count() or 1)),
+            loop="uvloop",
+            http="httptools",
+            log_level="info"
+        )
+    else:
+        uvicorn.run(
+            "main:app",
+            host=host,
+            port=port,
+            reload=True,
+            log_level="info"
+        )
\ No newline at end of file
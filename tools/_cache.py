@@ -0,0 +1,170 @@
+import asyncio
+import functools
+import hashlib
+import os
+from typing import Any
+
+import cachetools
+import orjson
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:
+    aioredis = None
+
+
+# "memory" keeps each worker's TTLCache private; "redis" adds a shared
+# second tier so only one worker ever pays the first-miss cost per query
+_BACKEND = os.environ.get("TOOLS_CACHE_BACKEND", "memory")
+
+_redis_client = None
+
+
+def _get_redis():
+    global _redis_client
+    if _redis_client is None:
+        if aioredis is None:
+            raise EnvironmentError(
+                "TOOLS_CACHE_BACKEND=redis requires the 'redis' package to be installed"
+            )
+        _redis_client = aioredis.from_url(
+            os.environ.get("REDIS_URL", "redis://localhost:6379/0"),
+            decode_responses=False
+        )
+    return _redis_client
+
+
+def _is_error_result(result: Any) -> bool:
+    """Tools report failures as an 'error' dict (or a one-dict list)"""
+    if isinstance(result, dict):
+        return "error" in result
+    if isinstance(result, list) and result and isinstance(result[0], dict):
+        return "error" in result[0]
+    return False
+
+
+def _redis_key(qualname: str, args: tuple, kwargs: dict) -> str:
+    params = orjson.dumps([args, sorted(kwargs.items())])
+    return f"tool:{qualname}:{hashlib.sha1(params).hexdigest()}"
+
+
+async def _redis_get(key: str) -> Any:
+    try:
+        value = await _get_redis().get(key)
+    except Exception:
+        return None
+    if value is None:
+        return None
+    return orjson.loads(value)
+
+
+async def _redis_set(key: str, value: Any, ttl: float) -> None:
+    try:
+        await _get_redis().setex(key, int(ttl), orjson.dumps(value))
+    except Exception:
+        # Unserializable result or Redis unavailable: the L1 cache and
+        # upstream API still serve the caller, so just skip the L2 write
+        return
+
+
+def ttl_cached(ttl: float, maxsize: int = 4096):
+    """
+    Cache an async tool method's results for ttl seconds.
+
+    Keys on the call arguments (minus self — tools are per-process
+    singletons). Error results are never cached, and calls with
+    unhashable arguments fall through to the network. When
+    TOOLS_CACHE_BACKEND=redis, a shared Redis tier sits between the
+    in-process cache and the upstream API so hits are shared across
+    workers.
+    """
+    def decorator(func):
+        cache: "cachetools.TTLCache" = cachetools.TTLCache(maxsize=maxsize, ttl=ttl)
+        lock = asyncio.Lock()
+        inflight: dict = {}
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            try:
+                key = (args[1:], tuple(sorted(kwargs.items())))
+                hash(key)
+            except TypeError:
+                return await func(*args, **kwargs)
+
+            # Single-flight: on a cold key the first caller owns the fetch
+            # and everyone arriving meanwhile awaits the same future, so the
+            # upstream API sees one request instead of N
+            async with lock:
+                if key in cache:
+                    return cache[key]
+                future = inflight.get(key)
+                # A cancelled future is a dead owner that hasn't been
+                # unpublished yet — claim the key rather than join it
+                if future is None or future.cancelled():
+                    future = asyncio.get_running_loop().create_future()
+                    inflight[key] = future
+                    owner = True
+                else:
+                    owner = False
+
+            if not owner:
+                # shield: a waiter cancelling (its client disconnected)
+                # must not cancel the shared future under the owner
+                try:
+                    return await asyncio.shield(future)
+                except asyncio.CancelledError:
+                    if future.cancelled():
+                        # The owner was cancelled, not us — take over
+                        # the fetch instead of failing this caller too
+                        return await wrapper(*args, **kwargs)
+                    raise
+
+            try:
+                use_redis = _BACKEND == "redis"
+                redis_key = None
+                result = None
+                if use_redis:
+                    redis_key = _redis_key(func.__qualname__, args[1:], kwargs)
+                    result = await _redis_get(redis_key)
+                    if result is not None:
+                        async with lock:
+                            cache[key] = result
+
+                if result is None:
+                    result = await func(*args, **kwargs)
+
+                    if not _is_error_result(result):
+                        async with lock:
+                            cache[key] = result
+                        if use_redis:
+                            await _redis_set(redis_key, result, ttl)
+
+                future.set_result(result)
+                return result
+
+            except Exception as e:
+                future.set_exception(e)
+                raise
+
+            finally:
+                # CancelledError is a BaseException, so a cancelled owner
+                # reaches here with the future still pending; resolve it
+                # before unpublishing or every coalesced waiter hangs
+                if not future.done():
+                    future.cancel()
+                async with lock:
+                    # A retrying waiter may have replaced our slot already
+                    if inflight.get(key) is future:
+                        del inflight[key]
+
+        return wrapper
+    return decorator
+
+
+async def preload(calls) -> None:
+    """Warm the caches with (async_method, kwargs) pairs, ignoring failures"""
+    for fn, kwargs in calls:
+        try:
+            await fn(**kwargs)
+        except Exception:
+            continue
@@ -0,0 +1,27 @@
+import functools
+
+import httpx
+
+
+class ToolError(Exception):
+    """Raised when an upstream tool API call fails"""
+
+
+def safe_tool(default):
+    """
+    Convert transport failures into the legacy {"error": ...} payload.
+
+    Tool bodies stay a straight line of I/O + projection and simply let
+    httpx.HTTPError (or ToolError) propagate; this decorator is the one
+    place that turns those into the error shape callers branch on.
+    `default` maps the exception to that shape (dict or one-dict list).
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            try:
+                return await func(*args, **kwargs)
+            except (ToolError, httpx.HTTPError) as e:
+                return default(e)
+        return wrapper
+    return decorator
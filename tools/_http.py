@@ -0,0 +1,38 @@
+import httpx
+from typing import Optional
+
+
+# Shared client so all tools reuse one connection pool instead of
+# opening a fresh TCP+TLS connection per call
+_client: Optional[httpx.AsyncClient] = None
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """Return the shared AsyncClient, creating it on first use"""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            # HTTP/2 multiplexes concurrent calls to the same host (e.g. a
+            # SERP search + answer box fan-out) over one TCP+TLS connection
+            http2=True,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            timeout=httpx.Timeout(30.0),
+            # Retry connect-level failures before they surface as tool errors
+            transport=httpx.AsyncHTTPTransport(retries=3),
+            headers={
+                "Accept": "application/json",
+                # Brotli shaves SerpAPI's large organic/images payloads
+                # well below their gzip size; httpx decodes both
+                "Accept-Encoding": "br, gzip",
+                "Connection": "keep-alive"
+            }
+        )
+    return _client
+
+
+async def close_async_client() -> None:
+    """Close the shared client (called on application shutdown)"""
+    global _client
+    if _client is not None and not _client.is_closed:
+        await _client.aclose()
+    _client = None
@@ -0,0 +1,91 @@
+import dataclasses
+from dataclasses import dataclass, field
+from typing import Dict, Any, List, Optional
+
+
+# Result rows for the high-volume list endpoints. slots=True drops the
+# per-instance dict (roughly half the memory of a literal dict row) and
+# frozen=True makes cached results safe to share between callers.
+# orjson serializes dataclasses natively, so responses are unchanged on
+# the wire; to_dict() covers callers that need a plain mapping.
+
+
+@dataclass(slots=True, frozen=True)
+class RepoItem:
+    """One GitHub repository row"""
+    name: Optional[str]
+    full_name: Optional[str]
+    description: Optional[str]
+    stars: Optional[int]
+    forks: Optional[int]
+    language: Optional[str]
+    url: Optional[str]
+    topics: List[str] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dataclasses.asdict(self)
+
+
+@dataclass(slots=True, frozen=True)
+class Article:
+    title: Optional[str]
+    description: Optional[str]
+    source: Optional[str]
+    author: Optional[str]
+    url: Optional[str]
+    published_at: Optional[str]
+    content: Optional[str]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dataclasses.asdict(self)
+
+
+@dataclass(slots=True, frozen=True)
+class Source:
+    id: Optional[str]
+    name: Optional[str]
+    description: Optional[str]
+    url: Optional[str]
+    category: Optional[str]
+    country: Optional[str]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dataclasses.asdict(self)
+
+
+@dataclass(slots=True, frozen=True)
+class SerpResult:
+    title: Optional[str]
+    link: Optional[str]
+    snippet: Optional[str]
+    displayed_link: Optional[str]
+    position: Optional[int]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dataclasses.asdict(self)
+
+
+@dataclass(slots=True, frozen=True)
+class NewsResult:
+    title: Optional[str]
+    link: Optional[str]
+    snippet: Optional[str]
+    source: Optional[str]
+    date: Optional[str]
+    thumbnail: Optional[str]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dataclasses.asdict(self)
+
+
+@dataclass(slots=True, frozen=True)
+class ImageResult:
+    title: Optional[str]
+    link: Optional[str]
+    source: Optional[str]
+    thumbnail: Optional[str]
+    original: Optional[str]
+    position: Optional[int]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dataclasses.asdict(self)
@@ -0,0 +1,73 @@
+from typing import Dict, Any
+
+from tools._models import Article, Source, SerpResult, NewsResult, ImageResult
+
+
+# One projection function per upstream record shape. The News and SERP
+# tools previously repeated these literal-dict loops inline per method;
+# keeping them here means one definition per shape and a plain list
+# comprehension at each call site.
+#
+# This module is deliberately free of framework imports and fully
+# annotated so it stays eligible for AOT compilation (mypyc/Cython)
+# should the project ever grow a build step.
+
+
+def project_article(article: Dict[str, Any]) -> Article:
+    """NewsAPI article -> the fields we return"""
+    return Article(
+        title=article.get("title"),
+        description=article.get("description"),
+        source=(article.get("source") or {}).get("name"),
+        author=article.get("author"),
+        url=article.get("url"),
+        published_at=article.get("publishedAt"),
+        content=article.get("content")
+    )
+
+
+def project_source(source: Dict[str, Any]) -> Source:
+    """NewsAPI source listing entry"""
+    return Source(
+        id=source.get("id"),
+        name=source.get("name"),
+        description=source.get("description"),
+        url=source.get("url"),
+        category=source.get("category"),
+        country=source.get("country")
+    )
+
+
+def project_serp_result(item: Dict[str, Any]) -> SerpResult:
+    """SerpAPI organic search result"""
+    return SerpResult(
+        title=item.get("title"),
+        link=item.get("link"),
+        snippet=item.get("snippet"),
+        displayed_link=item.get("displayed_link"),
+        position=item.get("position")
+    )
+
+
+def project_news_result(item: Dict[str, Any]) -> NewsResult:
+    """SerpAPI news search result"""
+    return NewsResult(
+        title=item.get("title"),
+        link=item.get("link"),
+        snippet=item.get("snippet"),
+        source=item.get("source"),
+        date=item.get("date"),
+        thumbnail=item.get("thumbnail")
+    )
+
+
+def project_image_result(item: Dict[str, Any]) -> ImageResult:
+    """SerpAPI image search result"""
+    return ImageResult(
+        title=item.get("title"),
+        link=item.get("link"),
+        source=item.get("source"),
+        thumbnail=item.get("thumbnail"),
+        original=item.get("original"),
+        position=item.get("position")
+    )
@@ -0,0 +1,40 @@
+import asyncio
+import threading
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+
+# Fan-out helper for call sites that cannot adopt asyncio (scripts,
+# notebooks, sync jobs). The tool methods are coroutines sharing one
+# httpx connection pool, so instead of a thread per request we keep a
+# single worker thread running a persistent event loop and gather the
+# calls there: same wall-time win, and keep-alive connections survive
+# between fan-outs. Do not use this from inside an already-running
+# event loop — await the coroutines directly there instead.
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    global _loop
+    if _loop is None or _loop.is_closed():
+        _loop = asyncio.new_event_loop()
+        # daemon=True so run_forever never blocks interpreter exit —
+        # sync scripts must be able to just fall off the end of main
+        threading.Thread(
+            target=_loop.run_forever, name="tools-io", daemon=True
+        ).start()
+    return _loop
+
+
+def fanout(calls: Sequence[Tuple[Any, Dict[str, Any]]]) -> List[Any]:
+    """Run [(tool_method, kwargs), ...] concurrently from sync code.
+
+    Results come back in call order; per-call failures surface as the
+    tools' usual {"error": ...} payloads, not exceptions.
+    """
+    loop = _get_loop()
+    futures = [
+        asyncio.run_coroutine_threadsafe(fn(**kwargs), loop)
+        for fn, kwargs in calls
+    ]
+    return [future.result() for future in futures]
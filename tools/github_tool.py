@@ -1,6 +1,65 @@
+import asyncio
 import os
-import requests
-from typing import Dict, List, Any, Optional
+import httpx
+import orjson
+from typing import Dict, List, Any, Optional, Tuple
+
+from tools._http import get_async_client
+from tools._errors import safe_tool
+from tools._models import RepoItem
+
+
+def _error(e: Exception) -> Dict[str, Any]:
+    return {"error": f"GitHub API request failed: {str(e)}"}
+
+
+def _error_list(e: Exception) -> List[Dict[str, Any]]:
+    return [_error(e)]
+
+
+# Per-repository selection for the batched GraphQL lookup; mirrors the
+# fields returned by get_repository
+_GRAPHQL_REPO_FIELDS = """
+    name
+    nameWithOwner
+    description
+    stargazerCount
+    forkCount
+    watchers { totalCount }
+    primaryLanguage { name }
+    url
+    createdAt
+    updatedAt
+    issues(states: OPEN) { totalCount }
+    repositoryTopics(first: 10) { nodes { topic { name } } }
+"""
+
+
+def _pick_repo(item: Dict[str, Any]) -> RepoItem:
+    """Project a search-result repo payload down to the fields we return"""
+    return RepoItem(
+        name=item.get("name"),
+        full_name=item.get("full_name"),
+        description=item.get("description"),
+        stars=item.get("stargazers_count"),
+        forks=item.get("forks_count"),
+        language=item.get("language"),
+        url=item.get("html_url"),
+        topics=item.get("topics", [])
+    )
+
+
+def _pick_user_repo(item: Dict[str, Any]) -> RepoItem:
+    """Same projection as _pick_repo minus topics (not in the user-repos payload)"""
+    return RepoItem(
+        name=item.get("name"),
+        full_name=item.get("full_name"),
+        description=item.get("description"),
+        stars=item.get("stargazers_count"),
+        forks=item.get("forks_count"),
+        language=item.get("language"),
+        url=item.get("html_url")
+    )
 
 
 class GitHubTool:
@@ -13,97 +72,147 @@ class GitHubTool:
         }
         if self.api_key:
             self.headers["Authorization"] = f"token {self.api_key}"
-    
-    def search_repositories(
+
+    @safe_tool(_error_list)
+    async def search_repositories(
         self,
         query: str,
         sort: str = "stars",
         limit: int = 5
+    ) -> List[Any]:
+
+        url = f"{self.base_url}/search/repositories"
+        params = {
+            "q": query,
+            "sort": sort,
+            "order": "desc",
+            "per_page": limit
+        }
+
+        client = get_async_client()
+        response = await client.get(url, headers=self.headers, params=params, timeout=10)
+        response.raise_for_status()
+
+        data = orjson.loads(response.content)
+        return [_pick_repo(item) for item in data.get("items", ())]
+
+    @safe_tool(_error)
+    async def get_repository(self, owner: str, repo: str) -> Dict[str, Any]:
+
+        url = f"{self.base_url}/repos/{owner}/{repo}"
+        client = get_async_client()
+        response = await client.get(url, headers=self.headers, timeout=10)
+        response.raise_for_status()
+
+        data = orjson.loads(response.content)
+        return {
+            "name": data.get("name"),
+            "full_name": data.get("full_name"),
+            "description": data.get("description"),
+            "stars": data.get("stargazers_count"),
+            "forks": data.get("forks_count"),
+            "watchers": data.get("watchers_count"),
+            "language": data.get("language"),
+            "url": data.get("html_url"),
+            "created_at": data.get("created_at"),
+            "updated_at": data.get("updated_at"),
+            "open_issues": data.get("open_issues_count"),
+            "topics": data.get("topics", [])
+        }
+
+    async def get_repositories_batch(
+        self,
+        refs: List[Tuple[str, str]]
     ) -> List[Dict[str, Any]]:
+        """Fetch several (owner, repo) pairs in one GraphQL round trip"""
 
-        try:
-            url = f"{self.base_url}/search/repositories"
-            params = {
-                "q": query,
-                "sort": sort,
-                "order": "desc",
-                "per_page": limit
-            }
-            
-            response = requests.get(url, headers=self.headers, params=params, timeout=10)
-            response.raise_for_status()
-            
-            data = response.json()
-            repos = []
-            
-            for item in data.get("items", []):
-                repos.append({
-                    "name": item.get("name"),
-                    "full_name": item.get("full_name"),
-                    "description": item.get("description"),
-                    "stars": item.get("stargazers_count"),
-                    "forks": item.get("forks_count"),
-                    "language": item.get("language"),
-                    "url": item.get("html_url"),
-                    "topics": item.get("topics", [])
-                })
-            
-            return repos
-        
-        except requests.exceptions.RequestException as e:
-            return [{"error": f"GitHub API request failed: {str(e)}"}]
-    
-    def get_repository(self, owner: str, repo: str) -> Dict[str, Any]:
+        if not refs:
+            return []
 
-        try:
-            url = f"{self.base_url}/repos/{owner}/{repo}"
-            response = requests.get(url, headers=self.headers, timeout=10)
-            response.raise_for_status()
-            
-            data = response.json()
-            return {
-                "name": data.get("name"),
-                "full_name": data.get("full_name"),
-                "description": data.get("description"),
-                "stars": data.get("stargazers_count"),
-                "forks": data.get("forks_count"),
-                "watchers": data.get("watchers_count"),
-                "language": data.get("language"),
-                "url": data.get("html_url"),
-                "created_at": data.get("created_at"),
-                "updated_at": data.get("updated_at"),
-                "open_issues": data.get("open_issues_count"),
-                "topics": data.get("topics", [])
-            }
-        
-        except requests.exceptions.RequestException as e:
-            return {"error": f"GitHub API request failed: {str(e)}"}
-    
-    def get_user_repos(self, username: str, limit: int = 5) -> List[Dict[str, Any]]:
+        # The GraphQL endpoint rejects unauthenticated requests, but
+        # running without GITHUB_API_KEY is supported everywhere else —
+        # fall back to concurrent per-ref REST lookups (not coalesced,
+        # but each result keeps its slot and the legacy error shape)
+        if not self.api_key:
+            return list(await asyncio.gather(
+                *(self.get_repository(owner, repo) for owner, repo in refs)
+            ))
+
+        blocks = []
+        for i, (owner, repo) in enumerate(refs):
+            # orjson.dumps produces correctly escaped GraphQL string literals
+            owner_lit = orjson.dumps(owner).decode()
+            repo_lit = orjson.dumps(repo).decode()
+            blocks.append(
+                f"repo{i}: repository(owner: {owner_lit}, name: {repo_lit}) "
+                f"{{ {_GRAPHQL_REPO_FIELDS} }}"
+            )
+
+        query = "query { " + " ".join(blocks) + " }"
 
+        # Handled inline rather than via @safe_tool: the error payload
+        # here must stay one dict per requested ref so the executor can
+        # reassemble batch results positionally
         try:
-            url = f"{self.base_url}/users/{username}/repos"
-            params = {
-                "sort": "updated",
-                "per_page": limit
-            }
-            
-            response = requests.get(url, headers=self.headers, params=params, timeout=10)
+            headers = {"Authorization": f"bearer {self.api_key}"} if self.api_key else {}
+            client = get_async_client()
+            response = await client.post(
+                f"{self.base_url}/graphql",
+                headers=headers,
+                json={"query": query},
+                timeout=15
+            )
             response.raise_for_status()
-            
-            repos = []
-            for item in response.json():
-                repos.append({
-                    "name": item.get("name"),
-                    "full_name": item.get("full_name"),
-                    "description": item.get("description"),
-                    "stars": item.get("stargazers_count"),
-                    "forks": item.get("forks_count"),
-                    "language": item.get("language"),
-                    "url": item.get("html_url")
-                })
-            
-            return repos
-        
-        except requests.exceptions.RequestException as e:
-            return [{"error": f"GitHub API request failed: {str(e)}"}]
\ No newline at end of file
+
+            payload = orjson.loads(response.content)
+            data = payload.get("data") or {}
+
+            results = []
+            for i, (owner, repo) in enumerate(refs):
+                node = data.get(f"repo{i}")
+                if node is None:
+                    results.append({"error": f"Repository '{owner}/{repo}' not found"})
+                    continue
+                results.append(self._pick_graphql_repo(node))
+
+            return results
+
+        except httpx.HTTPError as e:
+            return [_error(e) for _ in refs]
+
+    def _pick_graphql_repo(self, node: Dict[str, Any]) -> Dict[str, Any]:
+        """Map a GraphQL repository node onto the get_repository dict shape"""
+        language = node.get("primaryLanguage") or {}
+        topics = node.get("repositoryTopics") or {}
+        return {
+            "name": node.get("name"),
+            "full_name": node.get("nameWithOwner"),
+            "description": node.get("description"),
+            "stars": node.get("stargazerCount"),
+            "forks": node.get("forkCount"),
+            "watchers": (node.get("watchers") or {}).get("totalCount"),
+            "language": language.get("name"),
+            "url": node.get("url"),
+            "created_at": node.get("createdAt"),
+            "updated_at": node.get("updatedAt"),
+            "open_issues": (node.get("issues") or {}).get("totalCount"),
+            "topics": [
+                (n.get("topic") or {}).get("name")
+                for n in (topics.get("nodes") or [])
+            ]
+        }
+
+    @safe_tool(_error_list)
+    async def get_user_repos(self, username: str, limit: int = 5) -> List[Any]:
+
+        url = f"{self.base_url}/users/{username}/repos"
+        params = {
+            "sort": "updated",
+            "per_page": limit
+        }
+
+        client = get_async_client()
+        response = await client.get(url, headers=self.headers, params=params, timeout=10)
+        response.raise_for_status()
+
+        return [_pick_user_repo(item) for item in orjson.loads(response.content)]
@@ -1,61 +1,75 @@
+import functools
 import os
-import requests
-from typing import Dict, List, Any, Optional
-from datetime import datetime, timedelta
+import time
+import orjson
+from typing import Dict, List, Any, Optional, Tuple
+from datetime import datetime, timedelta, timezone
+
+from tools._http import get_async_client
+from tools._cache import ttl_cached
+from tools._errors import safe_tool
+from tools._project import project_article, project_source
+
+
+def _error_list(e: Exception) -> List[Dict[str, Any]]:
+    return [{"error": f"News API request failed: {str(e)}"}]
+
+
+@functools.lru_cache(maxsize=2)
+def _default_date_range(day_number: int) -> Tuple[str, str]:
+    """(from, to) strings for the last-7-days window, computed once per day"""
+    today = datetime.fromtimestamp(day_number * 86400, tz=timezone.utc)
+    return (
+        (today - timedelta(days=7)).strftime("%Y-%m-%d"),
+        today.strftime("%Y-%m-%d")
+    )
 
 
 class NewsTool:
     """Tool for interacting with News API"""
-    
+
     def __init__(self):
         self.api_key = os.environ.get("NEWS_API_KEY")
         self.base_url = "https://newsapi.org/v2"
-    
-    def get_top_headlines(
+        # Constant query parameters, frozen once; httpx accepts an
+        # ordered key-value sequence, so the default-argument path
+        # skips rebuilding (and rehashing) the same dict on every call
+        self._sources_base_params = (("apiKey", self.api_key), ("language", "en"))
+
+    @ttl_cached(ttl=300)
+    @safe_tool(_error_list)
+    async def get_top_headlines(
         self,
         country: str = "us",
         category: Optional[str] = None,
         query: Optional[str] = None,
         limit: int = 5
-    ) -> List[Dict[str, Any]]:
-  
-        try:
-            url = f"{self.base_url}/top-headlines"
-            params = {
-                "apiKey": self.api_key,
-                "pageSize": limit
-            }
-            
-            if country:
-                params["country"] = country
-            if category:
-                params["category"] = category
-            if query:
-                params["q"] = query
-            
-            response = requests.get(url, params=params, timeout=10)
-            response.raise_for_status()
-            
-            data = response.json()
-            
-            articles = []
-            for article in data.get("articles", []):
-                articles.append({
-                    "title": article.get("title"),
-                    "description": article.get("description"),
-                    "source": article.get("source", {}).get("name"),
-                    "author": article.get("author"),
-                    "url": article.get("url"),
-                    "published_at": article.get("publishedAt"),
-                    "content": article.get("content")
-                })
-            
-            return articles
-        
-        except requests.exceptions.RequestException as e:
-            return [{"error": f"News API request failed: {str(e)}"}]
-    
-    def search_news(
+    ) -> List[Any]:
+
+        url = f"{self.base_url}/top-headlines"
+        params = {
+            "apiKey": self.api_key,
+            "pageSize": limit
+        }
+
+        if country:
+            params["country"] = country
+        if category:
+            params["category"] = category
+        if query:
+            params["q"] = query
+
+        client = get_async_client()
+        response = await client.get(url, params=params, timeout=10)
+        response.raise_for_status()
+
+        data = orjson.loads(response.content)
+
+        return [project_article(article) for article in data.get("articles", ())]
+
+    @ttl_cached(ttl=300)
+    @safe_tool(_error_list)
+    async def search_news(
         self,
         query: str,
         from_date: Optional[str] = None,
@@ -63,78 +77,51 @@ class NewsTool:
         language: str = "en",
         sort_by: str = "relevancy",
         limit: int = 5
-    ) -> List[Dict[str, Any]]:
-
-        try:
-            url = f"{self.base_url}/everything"
-            
-            # Default date range: last 7 days
-            if not from_date:
-                from_date = (datetime.now() - timedelta(days=7)).strftime("%Y-%m-%d")
-            if not to_date:
-                to_date = datetime.now().strftime("%Y-%m-%d")
-            
-            params = {
-                "apiKey": self.api_key,
-                "q": query,
-                "from": from_date,
-                "to": to_date,
-                "language": language,
-                "sortBy": sort_by,
-                "pageSize": limit
-            }
-            
-            response = requests.get(url, params=params, timeout=10)
-            response.raise_for_status()
-            
-            data = response.json()
-            
-            articles = []
-            for article in data.get("articles", []):
-                articles.append({
-                    "title": article.get("title"),
-                    "description": article.get("description"),
-                    "source": article.get("source", {}).get("name"),
-                    "author": article.get("author"),
-                    "url": article.get("url"),
-                    "published_at": article.get("publishedAt"),
-                    "content": article.get("content")
-                })
-            
-            return articles
-        
-        except requests.exceptions.RequestException as e:
-            return [{"error": f"News API request failed: {str(e)}"}]
-    
-    def get_sources(self, category: Optional[str] = None, language: str = "en") -> List[Dict[str, Any]]:
-
-        try:
-            url = f"{self.base_url}/sources"
-            params = {
-                "apiKey": self.api_key,
-                "language": language
-            }
-            
-            if category:
-                params["category"] = category
-            
-            response = requests.get(url, params=params, timeout=10)
-            response.raise_for_status()
-            
-            data = response.json()
-            
-            sources = []
-            for source in data.get("sources", []):
-                sources.append({
-                    "id": source.get("id"),
-                    "name": source.get("name"),
-                    "description": source.get("description"),
-                    "url": source.get("url"),
-                    "category": source.get("category"),
-                    "country": source.get("country")
-                })
-            
-            return sources
-        
-        except requests.exceptions.RequestException as e:
-            return [{"error": f"News API request failed: {str(e)}"}]
\ No newline at end of file
+    ) -> List[Any]:
+
+        url = f"{self.base_url}/everything"
+
+        # Default date range: last 7 days, memoized per UTC day
+        if not from_date or not to_date:
+            default_from, default_to = _default_date_range(int(time.time()) // 86400)
+            from_date = from_date or default_from
+            to_date = to_date or default_to
+
+        params = {
+            "apiKey": self.api_key,
+            "q": query,
+            "from": from_date,
+            "to": to_date,
+            "language": language,
+            "sortBy": sort_by,
+            "pageSize": limit
+        }
+
+        client = get_async_client()
+        response = await client.get(url, params=params, timeout=10)
+        response.raise_for_status()
+
+        data = orjson.loads(response.content)
+
+        return [project_article(article) for article in data.get("articles", ())]
+
+    @ttl_cached(ttl=86400)
+    @safe_tool(_error_list)
+    async def get_sources(self, category: Optional[str] = None, language: str = "en") -> List[Any]:
+
+        url = f"{self.base_url}/sources"
+        if language == "en":
+            params = list(self._sources_base_params)
+        else:
+            params = [("apiKey", self.api_key), ("language", language)]
+
+        if category:
+            params.append(("category", category))
+
+        client = get_async_client()
+        response = await client.get(url, params=params, timeout=10)
+        response.raise_for_status()
+
+        data = orjson.loads(response.content)
+
+        return [project_source(source) for source in data.get("sources", ())]
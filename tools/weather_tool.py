@@ -1,115 +1,168 @@
 import os
-import requests
-from typing import Dict, Any
+import orjson
+from typing import Dict, List, Any
+
+from tools._http import get_async_client
+from tools._cache import ttl_cached
+from tools._errors import safe_tool
+
+
+def _error(e: Exception) -> Dict[str, Any]:
+    return {"error": f"Weather API request failed: {str(e)}"}
+
+
+def _error_list(e: Exception) -> List[Dict[str, Any]]:
+    return [_error(e)]
 
 
 class WeatherTool:
     """Tool for interacting with OpenWeather API"""
-    
+
     def __init__(self):
         self.api_key = os.environ.get("OPENWEATHER_API_KEY")
         self.base_url = "https://api.openweathermap.org/data/2.5"
-    
-    def get_current_weather(self, city: str, units: str = "metric") -> Dict[str, Any]:
 
-        try:
-            url = f"{self.base_url}/weather"
-            params = {
-                "q": city,
-                "appid": self.api_key,
-                "units": units
-            }
-            
-            response = requests.get(url, params=params, timeout=10)
-            response.raise_for_status()
-            
-            data = response.json()
-            
-            # Extract relevant information
-            weather_info = {
-                "city": data.get("name"),
-                "country": data.get("sys", {}).get("country"),
-                "temperature": data.get("main", {}).get("temp"),
-                "feels_like": data.get("main", {}).get("feels_like"),
-                "temp_min": data.get("main", {}).get("temp_min"),
-                "temp_max": data.get("main", {}).get("temp_max"),
-                "humidity": data.get("main", {}).get("humidity"),
-                "pressure": data.get("main", {}).get("pressure"),
-                "weather": data.get("weather", [{}])[0].get("main"),
-                "description": data.get("weather", [{}])[0].get("description"),
-                "wind_speed": data.get("wind", {}).get("speed"),
-                "clouds": data.get("clouds", {}).get("all"),
-                "units": "°C" if units == "metric" else "°F" if units == "imperial" else "K"
-            }
-            
-            return weather_info
-        
-        except requests.exceptions.RequestException as e:
-            return {"error": f"Weather API request failed: {str(e)}"}
-    
-    def get_weather_forecast(self, city: str, units: str = "metric") -> Dict[str, Any]:
-
-        try:
-            url = f"{self.base_url}/forecast"
-            params = {
-                "q": city,
-                "appid": self.api_key,
-                "units": units
-            }
-            
-            response = requests.get(url, params=params, timeout=10)
-            response.raise_for_status()
-            
-            data = response.json()
-            
-            # Extract forecast data (API returns 3-hour intervals)
-            forecasts = []
-            for item in data.get("list", [])[:8]:  # Get next 24 hours (8 x 3-hour intervals)
-                forecasts.append({
-                    "datetime": item.get("dt_txt"),
-                    "temperature": item.get("main", {}).get("temp"),
-                    "weather": item.get("weather", [{}])[0].get("main"),
-                    "description": item.get("weather", [{}])[0].get("description"),
-                    "humidity": item.get("main", {}).get("humidity"),
-                    "wind_speed": item.get("wind", {}).get("speed")
-                })
-            
-            return {
-                "city": data.get("city", {}).get("name"),
-                "country": data.get("city", {}).get("country"),
-                "forecasts": forecasts,
-                "units": "°C" if units == "metric" else "°F" if units == "imperial" else "K"
-            }
-        
-        except requests.exceptions.RequestException as e:
-            return {"error": f"Weather API request failed: {str(e)}"}
-    
-    def get_weather_by_coordinates(self, lat: float, lon: float, units: str = "metric") -> Dict[str, Any]:
-
-        try:
-            url = f"{self.base_url}/weather"
+    @ttl_cached(ttl=600)
+    @safe_tool(_error)
+    async def get_current_weather(self, city: str, units: str = "metric") -> Dict[str, Any]:
+
+        url = f"{self.base_url}/weather"
+        params = {
+            "q": city,
+            "appid": self.api_key,
+            "units": units
+        }
+
+        client = get_async_client()
+        response = await client.get(url, params=params, timeout=10)
+        response.raise_for_status()
+
+        data = orjson.loads(response.content)
+
+        return self._project_current(data, units)
+
+    @safe_tool(_error_list)
+    async def get_current_weather_batch(
+        self,
+        city_ids: List[int],
+        units: str = "metric"
+    ) -> List[Dict[str, Any]]:
+        """Current weather for up to 20 numeric city IDs per HTTP round trip"""
+
+        url = f"{self.base_url}/group"
+        results = []
+
+        # The group endpoint accepts at most 20 IDs per request
+        for start in range(0, len(city_ids), 20):
+            chunk = city_ids[start:start + 20]
             params = {
-                "lat": lat,
-                "lon": lon,
+                "id": ",".join(str(city_id) for city_id in chunk),
                 "appid": self.api_key,
                 "units": units
             }
-            
-            response = requests.get(url, params=params, timeout=10)
+
+            client = get_async_client()
+            response = await client.get(url, params=params, timeout=10)
             response.raise_for_status()
-            
-            data = response.json()
-            
-            return {
-                "location": f"{data.get('name')}, {data.get('sys', {}).get('country')}",
-                "temperature": data.get("main", {}).get("temp"),
-                "feels_like": data.get("main", {}).get("feels_like"),
-                "weather": data.get("weather", [{}])[0].get("main"),
-                "description": data.get("weather", [{}])[0].get("description"),
-                "humidity": data.get("main", {}).get("humidity"),
-                "wind_speed": data.get("wind", {}).get("speed"),
-                "units": "°C" if units == "metric" else "°F" if units == "imperial" else "K"
-            }
-        
-        except requests.exceptions.RequestException as e:
-            return {"error": f"Weather API request failed: {str(e)}"}
\ No newline at end of file
+
+            data = orjson.loads(response.content)
+            results.extend(
+                self._project_current(item, units)
+                for item in data.get("list", ())
+            )
+
+        return results
+
+    def _project_current(self, data: Dict[str, Any], units: str) -> Dict[str, Any]:
+        """Extract the relevant fields from one current-weather payload"""
+        # Bind the sub-dicts once instead of re-indexing per field
+        main = data.get("main") or {}
+        wind = data.get("wind") or {}
+        weather_list = data.get("weather") or ({},)
+        weather0 = weather_list[0]
+
+        return {
+            "city": data.get("name"),
+            "country": (data.get("sys") or {}).get("country"),
+            "temperature": main.get("temp"),
+            "feels_like": main.get("feels_like"),
+            "temp_min": main.get("temp_min"),
+            "temp_max": main.get("temp_max"),
+            "humidity": main.get("humidity"),
+            "pressure": main.get("pressure"),
+            "weather": weather0.get("main"),
+            "description": weather0.get("description"),
+            "wind_speed": wind.get("speed"),
+            "clouds": (data.get("clouds") or {}).get("all"),
+            "units": "°C" if units == "metric" else "°F" if units == "imperial" else "K"
+        }
+
+    @ttl_cached(ttl=1800)
+    @safe_tool(_error)
+    async def get_weather_forecast(self, city: str, units: str = "metric") -> Dict[str, Any]:
+
+        url = f"{self.base_url}/forecast"
+        params = {
+            "q": city,
+            "appid": self.api_key,
+            "units": units
+        }
+
+        client = get_async_client()
+        response = await client.get(url, params=params, timeout=10)
+        response.raise_for_status()
+
+        data = orjson.loads(response.content)
+
+        # Extract forecast data (API returns 3-hour intervals)
+        forecasts = []
+        for item in data.get("list", [])[:8]:  # Get next 24 hours (8 x 3-hour intervals)
+            main = item.get("main") or {}
+            weather0 = (item.get("weather") or ({},))[0]
+            forecasts.append({
+                "datetime": item.get("dt_txt"),
+                "temperature": main.get("temp"),
+                "weather": weather0.get("main"),
+                "description": weather0.get("description"),
+                "humidity": main.get("humidity"),
+                "wind_speed": (item.get("wind") or {}).get("speed")
+            })
+
+        city = data.get("city") or {}
+        return {
+            "city": city.get("name"),
+            "country": city.get("country"),
+            "forecasts": forecasts,
+            "units": "°C" if units == "metric" else "°F" if units == "imperial" else "K"
+        }
+
+    @ttl_cached(ttl=600)
+    @safe_tool(_error)
+    async def get_weather_by_coordinates(self, lat: float, lon: float, units: str = "metric") -> Dict[str, Any]:
+
+        url = f"{self.base_url}/weather"
+        params = {
+            "lat": lat,
+            "lon": lon,
+            "appid": self.api_key,
+            "units": units
+        }
+
+        client = get_async_client()
+        response = await client.get(url, params=params, timeout=10)
+        response.raise_for_status()
+
+        data = orjson.loads(response.content)
+
+        main = data.get("main") or {}
+        weather0 = (data.get("weather") or ({},))[0]
+        return {
+            "location": f"{data.get('name')}, {(data.get('sys') or {}).get('country')}",
+            "temperature": main.get("temp"),
+            "feels_like": main.get("feels_like"),
+            "weather": weather0.get("main"),
+            "description": weather0.get("description"),
+            "humidity": main.get("humidity"),
+            "wind_speed": (data.get("wind") or {}).get("speed"),
+            "units": "°C" if units == "metric" else "°F" if units == "imperial" else "K"
+        }